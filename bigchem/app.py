@@ -27,6 +27,9 @@ bigchem.conf.update(
     worker_prefetch_multiplier=settings.bigchem_prefetch_multiplier,
     worker_concurrency=settings.bigchem_worker_concurrency,
     result_expires=timedelta(seconds=settings.bigchem_result_expires),
+    redis_max_connections=settings.bigchem_redis_max_connections,
+    redis_socket_keepalive=settings.bigchem_redis_socket_keepalive,
+    redis_backend_health_check_interval=settings.bigchem_redis_health_check_interval,
 )
 
 # NOTE: If using SSL secured connection to broker, by default I am disabling
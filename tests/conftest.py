@@ -2,6 +2,7 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+from pydantic import TypeAdapter
 from qcio import ProgramInput, ProgramOutput, Structure
 
 
@@ -74,7 +75,32 @@ def prog_output(prog_inp):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_dir():
     """Test data directory Path"""
     return Path(__file__).parent / "test_data"
+
+
+@pytest.fixture(scope="session")
+def hessian_gradients(test_data_dir):
+    """Gradients used to assemble hessian_answer. Parsed once per session."""
+    # Parse and validate the whole list in a single pass
+    return TypeAdapter(list[ProgramOutput]).validate_json(
+        (test_data_dir / "hessian_gradients.json").read_bytes()
+    )
+
+
+@pytest.fixture(scope="session")
+def hessian_answer(test_data_dir):
+    """Hessian ProgramOutput. Parsed once per session."""
+    return ProgramOutput.model_validate_json(
+        (test_data_dir / "hessian_answer.json").read_bytes()
+    )
+
+
+@pytest.fixture(scope="session")
+def frequency_answer(test_data_dir):
+    """Frequency analysis ProgramOutput. Parsed once per session."""
+    return ProgramOutput.model_validate_json(
+        (test_data_dir / "frequency_analysis_answer.json").read_bytes()
+    )
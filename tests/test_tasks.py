@@ -1,5 +1,3 @@
-import json
-
 import numpy as np
 import pytest
 from qcio import (
@@ -16,133 +14,98 @@ from bigchem.tasks import assemble_hessian, compute, frequency_analysis, output_
 from qcop.exceptions import QCOPBaseError
 
 
-def test_hessian_task(test_data_dir, water):
+def test_hessian_task(hessian_gradients, hessian_answer):
     """Ensure that my hessian implementation matches previous result from Umberto"""
 
-    with open(test_data_dir / "hessian_gradients.json") as f:
-        gradients = [ProgramOutput(**g) for g in json.load(f)]
-
     # Testing task in foreground since no QC package is required
     # 5.03e-3 was the dh used to create these gradients
-    prog_output = assemble_hessian(gradients, 5.0e-3)
-
-    answer = ProgramOutput.model_validate_json(
-        (test_data_dir / "hessian_answer.json").read_text()
-    )
+    # Pass a copy of the list since assemble_hessian pops the final energy calculation
+    prog_output = assemble_hessian(list(hessian_gradients), 5.0e-3)
 
     np.testing.assert_almost_equal(
-        prog_output.results.hessian, answer.results.hessian, decimal=7
+        prog_output.results.hessian, hessian_answer.results.hessian, decimal=7
     )
     assert prog_output.input_data.calctype == "hessian"
 
 
 def compare_eigenvector_arrays(arr1, arr2, decimal=6):
-    for i, (vec1, vec2) in enumerate(
-        zip(arr1.reshape(-1, arr1.shape[-1]), arr2.reshape(-1, arr2.shape[-1]))
-    ):
-        try:
-            np.testing.assert_almost_equal(vec1, vec2, decimal=decimal)
-        except AssertionError:
-            np.testing.assert_almost_equal(
-                vec1,
-                -vec2,
-                decimal=decimal,
-                err_msg=f"Eigenvectors at position {i} are not equal even considering "
-                "a sign difference.",
-            )
-
-
-def test_frequency_analysis_task(test_data_dir):
-    hessian_ar = ProgramOutput.model_validate_json(
-        (test_data_dir / "hessian_answer.json").read_text()
-    )
-    output = frequency_analysis(hessian_ar)
-
-    answer = ProgramOutput.model_validate_json(
-        (test_data_dir / "frequency_analysis_answer.json").read_text()
-    )
-
-    np.testing.assert_almost_equal(
-        output.results.freqs_wavenumber,
-        answer.results.freqs_wavenumber,
-        decimal=0,
-    )
-    compare_eigenvector_arrays(
-        output.results.normal_modes_cartesian,
-        answer.results.normal_modes_cartesian,
-        decimal=4,
-    )
+    vecs1 = arr1.reshape(-1, arr1.shape[-1])
+    vecs2 = arr2.reshape(-1, arr2.shape[-1])
+    # Eigenvectors are only defined up to a sign; flip vecs2 to align with vecs1
+    signs = np.where(np.einsum("ij,ij->i", vecs1, vecs2) < 0, -1.0, 1.0)
     np.testing.assert_almost_equal(
-        output.results.gibbs_free_energy,
-        answer.results.gibbs_free_energy,
-        decimal=2,
+        vecs1,
+        vecs2 * signs[:, np.newaxis],
+        decimal=decimal,
+        err_msg="Eigenvectors are not equal even considering a sign difference.",
     )
 
 
-def test_frequency_analysis_task_kwargs(test_data_dir):
-    hessian_ar = ProgramOutput.model_validate_json(
-        (test_data_dir / "hessian_answer.json").read_text()
-    )
-    answer = ProgramOutput.model_validate_json(
-        (test_data_dir / "frequency_analysis_answer.json").read_text()
-    )
-
-    output = frequency_analysis(hessian_ar, temperature=310, pressure=1.2)
+@pytest.mark.parametrize(
+    "kwargs,expected_gibbs",
+    (
+        # None means compare to the answer file, which was computed with no kwargs
+        ({}, None),
+        ({"temperature": 310, "pressure": 1.2}, -76.38277740247364),
+    ),
+)
+def test_frequency_analysis_task(
+    hessian_answer, frequency_answer, kwargs, expected_gibbs
+):
+    output = frequency_analysis(hessian_answer, **kwargs)
 
     np.testing.assert_almost_equal(
         output.results.freqs_wavenumber,
-        answer.results.freqs_wavenumber,
+        frequency_answer.results.freqs_wavenumber,
         decimal=0,
     )
     compare_eigenvector_arrays(
         output.results.normal_modes_cartesian,
-        answer.results.normal_modes_cartesian,
+        frequency_answer.results.normal_modes_cartesian,
         decimal=4,
     )
-
+    if expected_gibbs is None:
+        expected_gibbs = frequency_answer.results.gibbs_free_energy
     np.testing.assert_almost_equal(
-        output.results.gibbs_free_energy,
-        -76.38277740247364,  # Different number from answer computed with no kwargs
-        decimal=2,
+        output.results.gibbs_free_energy, expected_gibbs, decimal=2
     )
 
 
-@pytest.mark.parametrize(
-    "program,model,keywords,batch",
-    (
-        ("psi4", {"method": "HF", "basis": "sto-3g"}, {}, False),
-        ("rdkit", {"method": "UFF"}, {}, False),
-        ("xtb", {"method": "GFN2xTB"}, {"accuracy": 1.0, "max_iterations": 20}, False),
-        ("xtb", {"method": "GFN2xTB"}, {"accuracy": 1.0, "max_iterations": 20}, True),
-    ),
-)
 @pytest.mark.timeout(65)
-def test_compute(hydrogen, program, model, keywords, batch):
+def test_compute(hydrogen):
     """Testings as one function so we don't submit excess compute jobs.
 
+    All cases are submitted as a single group so workers can run them concurrently
+    rather than waiting on each round-trip in turn.
+
     NOTE: Timeout is long because the worker instance may be waiting to connect to
     RabbitMQ if it just started up. Celery's exponential back off means that
     it's possible a few early misses on worker -> MQ connection results in the
     worker waiting up for 8 seconds (or longer) to retry connecting.
     """
-    prog_input = ProgramInput(
-        structure=hydrogen, calctype="energy", model=model, keywords=keywords
+    cases = (
+        # program, model, keywords, batch
+        ("psi4", {"method": "HF", "basis": "sto-3g"}, {}, False),
+        ("rdkit", {"method": "UFF"}, {}, False),
+        ("xtb", {"method": "GFN2xTB"}, {"accuracy": 1.0, "max_iterations": 20}, False),
+        ("xtb", {"method": "GFN2xTB"}, {"accuracy": 1.0, "max_iterations": 20}, True),
     )
-    sig = compute.s(program, prog_input)
-    if batch:
-        # Make list of inputs
-        sig = group([sig] * 2)
+    sigs = []
+    for program, model, keywords, batch in cases:
+        prog_input = ProgramInput(
+            structure=hydrogen, calctype="energy", model=model, keywords=keywords
+        )
+        sig = compute.s(program, prog_input)
+        # Batch submits the same input twice
+        sigs.extend([sig] * 2 if batch else [sig])
 
     # Submit Job
-    future_result = sig.delay()
+    future_result = group(sigs).delay()
     result = future_result.get()
 
     # Assertions
     assert future_result.ready() is True
-
-    # Check assertions about single results and groups
-    if not isinstance(result, list):
-        result = [result]
+    assert len(result) == len(sigs)
     for r in result:
         assert isinstance(r, ProgramOutput)
 